@@ -1,20 +1,60 @@
 # Copyright (c) OpenMMLab. All rights reserved.
+import weakref
 from itertools import product
-from typing import List, Optional, Sequence, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 import mmengine
 import numpy as np
 import torch
-import torch.nn.functional as F
+from mmengine.dist import get_world_size
 from mmengine.evaluator import BaseMetric
 
 from mmpretrain.registry import METRICS
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _prf1_count_numba(pred_label, target, num_classes):
+        """Count per-class tp/pred/gt in a single compiled pass."""
+        tp = np.zeros(num_classes, dtype=np.int64)
+        pred_sum = np.zeros(num_classes, dtype=np.int64)
+        gt_sum = np.zeros(num_classes, dtype=np.int64)
+        for i in range(pred_label.shape[0]):
+            p = pred_label[i]
+            t = target[i]
+            pred_sum[p] += 1
+            gt_sum[t] += 1
+            if p == t:
+                tp[p] += 1
+        return tp, pred_sum, gt_sum
+else:
+    _prf1_count_numba = None
+
 
 def to_tensor(value):
     """Convert value to torch.Tensor."""
     if isinstance(value, np.ndarray):
         value = torch.from_numpy(value)
+    elif isinstance(value, (list, tuple)):
+        # ``np.asarray`` parses the sequence in a single C-level loop and
+        # ``torch.from_numpy`` wraps the result zero-copy, which is much
+        # faster than the per-element conversion of ``torch.tensor``.
+        try:
+            arr = np.asarray(value)
+        except ValueError:
+            arr = None
+        if arr is None or arr.dtype == object:
+            value = torch.tensor(value)
+        else:
+            if arr.dtype == np.float64:
+                # keep the default dtype of ``torch.tensor`` for floats
+                arr = arr.astype(np.float32)
+            value = torch.from_numpy(arr)
     elif isinstance(value, Sequence) and not mmengine.is_str(value):
         value = torch.tensor(value)
     elif not isinstance(value, torch.Tensor):
@@ -22,6 +62,181 @@ def to_tensor(value):
     return value
 
 
+class _SharedBatchScores:
+    """Single-slot cache for the stacked ``pred_score`` tensor of a batch.
+
+    Evaluators commonly attach several of the metrics below (e.g.
+    :class:`Accuracy`, :class:`SingleLabelMetric` and
+    :class:`ConfusionMatrix`) to the same run, and each of them used to
+    re-stack the per-sample score tensors and re-run the top-1 reduction
+    over the same (N, C) scores. The slot is keyed on weak references to
+    every score tensor of the batch — the identity comparison is O(N) but
+    trivial next to the stack itself — so it only hits when all samples
+    are the same objects, is invalidated as soon as the next batch
+    arrives, and never keeps the scores alive by itself.
+    """
+
+    def __init__(self):
+        self._keys = None
+        self._stack = None
+        self._max1 = None
+
+    def _hit(self, data_samples):
+        if self._keys is None or len(self._keys) != len(data_samples):
+            return False
+        return all(
+            key() is data_sample['pred_score']
+            for key, data_sample in zip(self._keys, data_samples))
+
+    def stack(self, data_samples):
+        """Return the stacked (N, C) score tensor of the batch."""
+        if not self._hit(data_samples):
+            self._keys = [
+                weakref.ref(data_sample['pred_score'])
+                for data_sample in data_samples
+            ]
+            self._stack = torch.stack(
+                [data_sample['pred_score'] for data_sample in data_samples])
+            self._max1 = None
+        return self._stack
+
+    def max1(self, data_samples):
+        """Return the stacked scores and their shared top-1 reduction."""
+        pred = self.stack(data_samples)
+        if self._max1 is None:
+            self._max1 = pred.float().max(dim=1)
+        return pred, self._max1
+
+
+_batch_scores = _SharedBatchScores()
+
+
+def _async_to_cpu(tensor):
+    """Copy a tensor to CPU without blocking the current CUDA stream.
+
+    The copy is staged through a pinned-memory tensor and issued with
+    ``non_blocking=True``, so it can overlap with the computation of the
+    following batches. The caller must synchronize the CUDA device before
+    reading the returned tensor.
+    """
+    if not tensor.is_cuda:
+        return tensor.cpu()
+    out = torch.empty_like(tensor, device='cpu', pin_memory=True)
+    out.copy_(tensor, non_blocking=True)
+    return out
+
+
+def _to_collect_device(tensor, collect_device):
+    """Move a metric state tensor to the device used for result collection.
+
+    With ``collect_device='cpu'`` (the default) the state is staged to CPU
+    through pinned memory right away, overlapping the copy with the next
+    batches. With ``collect_device='gpu'`` the state stays on the device,
+    which only skips that staging and defers the transfer to collection
+    time: ``BaseMetric.evaluate`` serializes the gathered results and casts
+    them to CPU before ``compute_metrics`` runs, so the final reduction is
+    on CPU either way.
+    """
+    if collect_device == 'gpu' and tensor.is_cuda:
+        return tensor.detach()
+    return _async_to_cpu(tensor)
+
+
+def _sync_cuda():
+    """Wait for the copies issued by :func:`_async_to_cpu` to finish."""
+    if torch.cuda.is_available() and torch.cuda.is_initialized():
+        torch.cuda.synchronize()
+
+
+def _format_thr_suffixes(thrs):
+    """Format the per-threshold metric-name suffixes.
+
+    The thresholds are fixed by the config, so the metrics format these
+    once at ``__init__`` time instead of rebuilding the strings at every
+    evaluation.
+    """
+    if len(thrs) == 1:
+        return ('', )
+    return tuple('_no-thr' if thr is None else f'_thr-{thr:.2f}'
+                 for thr in thrs)
+
+
+def _bucket_state(tensors):
+    """Pack a batch's counters into one contiguous tensor, so synchronizing
+    the record needs one transfer or collective instead of one per buffer."""
+    return torch.cat([tensor.reshape(-1) for tensor in tensors])
+
+
+_EPS = torch.finfo(torch.float32).eps
+
+
+@torch.jit.script
+def _prf_none(tp_sum: torch.Tensor, pred_sum: torch.Tensor,
+              gt_sum: torch.Tensor,
+              eps: float) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor,
+                                   torch.Tensor]:
+    """Scripted precision/recall/f1/support of every category."""
+    zeros = torch.zeros_like(tp_sum, dtype=torch.float32)
+    precision = torch.where(pred_sum > 0, tp_sum * (100. / pred_sum), zeros)
+    recall = torch.where(gt_sum > 0, tp_sum * (100. / gt_sum), zeros)
+    f1_score = 2 * precision * recall / torch.clamp(
+        precision + recall, min=eps)
+    return precision, recall, f1_score, gt_sum
+
+
+@torch.jit.script
+def _prf_macro(tp_sum: torch.Tensor, pred_sum: torch.Tensor,
+               gt_sum: torch.Tensor,
+               eps: float) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor,
+                                    torch.Tensor]:
+    """Scripted precision/recall/f1/support averaged over categories."""
+    zeros = torch.zeros_like(tp_sum, dtype=torch.float32)
+    precision = torch.where(pred_sum > 0, tp_sum * (100. / pred_sum), zeros)
+    recall = torch.where(gt_sum > 0, tp_sum * (100. / gt_sum), zeros)
+    f1_score = 2 * precision * recall / torch.clamp(
+        precision + recall, min=eps)
+    return precision.mean(0), recall.mean(0), f1_score.mean(0), gt_sum.sum(0)
+
+
+@torch.jit.script
+def _prf_micro(tp_sum: torch.Tensor, pred_sum: torch.Tensor,
+               gt_sum: torch.Tensor,
+               eps: float) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor,
+                                    torch.Tensor]:
+    """Scripted precision/recall/f1/support on the summed confusion
+    counts."""
+    tp_total = tp_sum.sum()
+    pred_total = pred_sum.sum()
+    gt_total = gt_sum.sum()
+    zeros = torch.zeros_like(tp_total, dtype=torch.float32)
+    precision = torch.where(pred_total > 0,
+                            tp_total * (100. / pred_total), zeros)
+    recall = torch.where(gt_total > 0, tp_total * (100. / gt_total), zeros)
+    f1_score = 2 * precision * recall / torch.clamp(
+        precision + recall, min=eps)
+    return precision, recall, f1_score, gt_total
+
+
+def _precision_recall_f1_from_counts(tp_sum, pred_sum, gt_sum, average):
+    """calculate precision, recall, f1_score and support from the per-class
+    counts of true positives, positive predictions and positive targets.
+
+    The heavy lifting is done in TorchScript functions specialized for each
+    ``average`` mode, so the elementwise chains fuse into a few kernels
+    without Python dispatch overhead.
+    """
+    average_options = ['micro', 'macro', None]
+    assert average in average_options, 'Invalid `average` argument, ' \
+        f'please specify from {average_options}.'
+
+    if average == 'micro':
+        return _prf_micro(tp_sum, pred_sum, gt_sum, _EPS)
+    elif average == 'macro':
+        return _prf_macro(tp_sum, pred_sum, gt_sum, _EPS)
+    else:
+        return _prf_none(tp_sum, pred_sum, gt_sum, _EPS)
+
+
 def _precision_recall_f1_support(pred_positive, gt_positive, average):
     """calculate base classification task metrics, such as  precision, recall,
     f1_score, support."""
@@ -37,27 +252,10 @@ def _precision_recall_f1_support(pred_positive, gt_positive, average):
     gt_positive[ignored_index] = 0
 
     class_correct = (pred_positive & gt_positive)
-    if average == 'micro':
-        tp_sum = class_correct.sum()
-        pred_sum = pred_positive.sum()
-        gt_sum = gt_positive.sum()
-    else:
-        tp_sum = class_correct.sum(0)
-        pred_sum = pred_positive.sum(0)
-        gt_sum = gt_positive.sum(0)
-
-    precision = tp_sum / torch.clamp(pred_sum, min=1).float() * 100
-    recall = tp_sum / torch.clamp(gt_sum, min=1).float() * 100
-    f1_score = 2 * precision * recall / torch.clamp(
-        precision + recall, min=torch.finfo(torch.float32).eps)
-    if average in ['macro', 'micro']:
-        precision = precision.mean(0)
-        recall = recall.mean(0)
-        f1_score = f1_score.mean(0)
-        support = gt_sum.sum(0)
-    else:
-        support = gt_sum
-    return precision, recall, f1_score, support
+    tp_sum = class_correct.sum(0)
+    pred_sum = pred_positive.sum(0)
+    gt_sum = gt_positive.sum(0)
+    return _precision_recall_f1_from_counts(tp_sum, pred_sum, gt_sum, average)
 
 
 @METRICS.register_module()
@@ -137,26 +335,86 @@ class Accuracy(BaseMetric):
         else:
             self.thrs = tuple(thrs)
 
+        # The overwhelmingly common config is top-1 only with a single (or
+        # no) threshold; specialize it at init time so every batch runs one
+        # fused max/eq/sum pass instead of the generic broadcast machinery.
+        self._top1_only = (
+            self.topk == (1, ) and self.thrs in ((0., ), (None, )))
+        self._thr_suffixes = _format_thr_suffixes(self.thrs)
+
     def process(self, data_batch, data_samples: Sequence[dict]):
         """Process one batch of data samples.
 
         The processed results should be stored in ``self.results``, which will
         be used to computed the metrics when all batches have been processed.
+        Only the sufficient statistics of the batch (the number of correct
+        predictions on every ``topk`` and ``thrs``) are stored, instead of
+        the raw predictions, so the memory footprint of the metric doesn't
+        grow with the size of the dataset. In distributed evaluation the
+        statistics are kept per sample instead, so that ``collect_results``
+        can drop the duplicated samples the sampler pads ranks with.
 
         Args:
             data_batch: A batch of data from the dataloader.
             data_samples (Sequence[dict]): A batch of outputs from the model.
         """
-
-        for data_sample in data_samples:
-            result = dict()
-            if 'pred_score' in data_sample:
-                result['pred_score'] = data_sample['pred_score'].cpu()
+        if len(data_samples) == 0:
+            return
+
+        target = torch.cat(
+            [data_sample['gt_label'] for data_sample in data_samples])
+        if 'pred_score' in data_samples[0]:
+            if self._top1_only:
+                _, (pred_score, pred_label) = _batch_scores.max1(data_samples)
+                sample_correct = self._count_correct_top1(
+                    pred_score, pred_label, target,
+                    self.thrs[0]).view(-1, 1, 1)
             else:
-                result['pred_label'] = data_sample['pred_label'].cpu()
-            result['gt_label'] = data_sample['gt_label'].cpu()
-            # Save the result to `self.results`.
-            self.results.append(result)
+                pred = _batch_scores.stack(data_samples)
+                try:
+                    sample_correct = self._count_correct(
+                        pred, target, self.topk, self.thrs)
+                except ValueError as e:
+                    # If the topk is invalid.
+                    raise ValueError(
+                        str(e) + ' Please check the `val_evaluator` and '
+                        '`test_evaluator` fields in your config file.')
+            if get_world_size() > 1:
+                rows = _to_collect_device(sample_correct, self.collect_device)
+                self.results.extend(dict(topk_correct=row) for row in rows)
+                return
+            correct = sample_correct.sum(0)
+            state = _bucket_state(
+                (correct, correct.new_tensor([target.size(0)])))
+            result = dict(
+                topk_correct=_to_collect_device(state, self.collect_device))
+        else:
+            # If only label in the `pred_label`.
+            pred = torch.cat(
+                [data_sample['pred_label'] for data_sample in data_samples])
+            correct = pred.eq(target)
+            if get_world_size() > 1:
+                rows = _to_collect_device(correct, self.collect_device)
+                self.results.extend(dict(correct=row) for row in rows)
+                return
+            count = correct.sum()
+            state = _bucket_state((count, count.new_tensor(target.size(0))))
+            result = dict(
+                correct=_to_collect_device(state, self.collect_device))
+        # Save the result to `self.results`.
+        self.results.append(result)
+
+    def evaluate(self, size: int) -> dict:
+        """Evaluate the metrics after all batches have been processed.
+
+        Waits for the asynchronous device-to-host copies staged in
+        :meth:`process` first: ``collect_results`` serializes the results on
+        every rank before :meth:`compute_metrics` runs (and non-main ranks
+        never run it at all), so synchronizing any later would let in-flight
+        copies be collected.
+        """
+        _sync_cuda()
+        return super().evaluate(size)
 
     def compute_metrics(self, results: List):
         """Compute the metrics from processed results.
@@ -171,34 +429,121 @@ class Accuracy(BaseMetric):
         # NOTICE: don't access `self.results` from the method.
         metrics = {}
 
-        # concat
-        target = torch.cat([res['gt_label'] for res in results])
-        if 'pred_score' in results[0]:
-            pred = torch.stack([res['pred_score'] for res in results])
-
-            try:
-                acc = self.calculate(pred, target, self.topk, self.thrs)
-            except ValueError as e:
-                # If the topk is invalid.
-                raise ValueError(
-                    str(e) + ' Please check the `val_evaluator` and '
-                    '`test_evaluator` fields in your config file.')
+        # accumulate the bucketed statistics of every batch in-place
+        # instead of materializing intermediate tensors for every partial
+        # sum
+        if 'topk_correct' in results[0]:
+            if results[0]['topk_correct'].ndim == 2:
+                # per-sample records from a distributed evaluation, already
+                # truncated to the dataset size by ``collect_results``
+                correct = torch.stack(
+                    [res['topk_correct'] for res in results]).sum(0)
+                num = len(results)
+            else:
+                state = results[0]['topk_correct'].clone()
+                for res in results[1:]:
+                    state += res['topk_correct']
+                num = int(state[-1])
+                correct = state[:-1].view(len(self.topk), len(self.thrs))
 
-            multi_thrs = len(self.thrs) > 1
             for i, k in enumerate(self.topk):
-                for j, thr in enumerate(self.thrs):
-                    name = f'top{k}'
-                    if multi_thrs:
-                        name += '_no-thr' if thr is None else f'_thr-{thr:.2f}'
-                    metrics[name] = acc[i][j].item()
+                for j, suffix in enumerate(self._thr_suffixes):
+                    metrics[f'top{k}' + suffix] = \
+                        100. * correct[i, j].item() / num
         else:
-            # If only label in the `pred_label`.
-            pred = torch.cat([res['pred_label'] for res in results])
-            acc = self.calculate(pred, target, self.topk, self.thrs)
-            metrics['top1'] = acc.item()
+            if results[0]['correct'].ndim == 0:
+                correct = torch.stack([res['correct'] for res in results])
+                metrics['top1'] = \
+                    100. * correct.sum().item() / len(results)
+            else:
+                state = results[0]['correct'].clone()
+                for res in results[1:]:
+                    state += res['correct']
+                metrics['top1'] = 100. * state[0].item() / int(state[1])
 
         return metrics
 
+    @staticmethod
+    def _count_correct_top1(pred_score: torch.Tensor,
+                            pred_label: torch.Tensor, target: torch.Tensor,
+                            thr: Optional[float]) -> torch.Tensor:
+        """Specialized correct counting for the ``topk=(1, )`` single
+        threshold config.
+
+        Args:
+            pred_score (torch.Tensor): The top-1 prediction scores with
+                shape (N, ).
+            pred_label (torch.Tensor): The top-1 prediction labels with
+                shape (N, ).
+            target (torch.Tensor): The target of each prediction with
+                shape (N, ).
+            thr (float | None): Predictions with scores under the threshold
+                are considered negative. None means no threshold.
+
+        Returns:
+            torch.Tensor: The per-sample correctness with shape ``(N, )``.
+        """
+        correct = pred_label.eq(target)
+        if thr is not None:
+            correct = correct & (pred_score > thr)
+        return correct
+
+    @staticmethod
+    def _count_correct(
+        pred: torch.Tensor,
+        target: torch.Tensor,
+        topk: Sequence[int] = (1, ),
+        thrs: Sequence[Union[float, None]] = (0., ),
+    ) -> torch.Tensor:
+        """Count the number of correct predictions.
+
+        Args:
+            pred (torch.Tensor): The prediction scores of every class with
+                shape (N, C).
+            target (torch.Tensor): The target of each prediction with
+                shape (N, ).
+            topk (Sequence[int]): If the ground truth label matches one of
+                the best **k** predictions, the sample will be counted as
+                correct. Defaults to (1, ).
+            thrs (Sequence[float | None]): Predictions with scores under
+                the thresholds are considered negative. None means no
+                thresholds. Defaults to (0., ).
+
+        Returns:
+            torch.Tensor: The per-sample correct prediction counts on every
+            ``topk`` and ``thrs`` with shape ``(N, len(topk), len(thrs))``.
+        """
+        pred = pred.float()
+        maxk = max(topk)
+
+        if maxk > pred.size(1):
+            raise ValueError(
+                f'Top-{maxk} accuracy is unavailable since the number of '
+                f'categories is {pred.size(1)}.')
+
+        if maxk == 1:
+            # torch.max dispatches to the dedicated reduce kernel, which
+            # is faster than the selection-based topk kernel for k=1.
+            pred_score, pred_label = pred.max(dim=1, keepdim=True)
+        else:
+            pred_score, pred_label = pred.topk(maxk, dim=1)
+        correct = pred_label.eq(target.view(-1, 1).expand_as(pred_label))
+        # Only prediction values larger than thr are counted as correct.
+        # All (k, thr) pairs are counted in a single pass over the scores
+        # by broadcasting to a (N, maxk, len(thrs)) mask and reading the
+        # cumulative sums over the maxk dim at every k.
+        thrs_t = torch.tensor(
+            [float('-inf') if thr is None else thr for thr in thrs],
+            device=pred.device).view(1, 1, -1)
+        mask = correct.unsqueeze(-1) & (pred_score.unsqueeze(-1) > thrs_t)
+        # accumulate in the narrowest integer type that can hold maxk, to
+        # halve the bandwidth of the (N, maxk, len(thrs)) intermediate;
+        # the final reduction over samples widens to int64 exactly
+        acc_dtype = torch.int16 if maxk < 2**15 else torch.int32
+        cumulative = mask.to(acc_dtype).cumsum(dim=1)
+        keep = torch.tensor([k - 1 for k in topk], device=pred.device)
+        return cumulative.index_select(1, keep)
+
     @staticmethod
     def calculate(
         pred: Union[torch.Tensor, np.ndarray, Sequence],
@@ -244,34 +589,20 @@ class Accuracy(BaseMetric):
         if pred.ndim == 1:
             # For pred label, ignore topk and acc
             pred_label = pred.int()
-            correct = pred.eq(target).float().sum(0, keepdim=True)
-            acc = correct.mul_(100. / num)
+            # sum the bool tensor as integers directly; promoting to float
+            # first would double the bandwidth of the reduction
+            correct = pred.eq(target).sum(0, keepdim=True, dtype=torch.int64)
+            acc = correct.float().mul_(100. / num)
             return acc
         else:
             # For pred score, calculate on all topk and thresholds.
-            pred = pred.float()
-            maxk = max(topk)
-
-            if maxk > pred.size(1):
-                raise ValueError(
-                    f'Top-{maxk} accuracy is unavailable since the number of '
-                    f'categories is {pred.size(1)}.')
-
-            pred_score, pred_label = pred.topk(maxk, dim=1)
-            pred_label = pred_label.t()
-            correct = pred_label.eq(target.view(1, -1).expand_as(pred_label))
+            counts = Accuracy._count_correct(pred, target, topk,
+                                             thrs).sum(0)
             results = []
-            for k in topk:
+            for i, k in enumerate(topk):
                 results.append([])
-                for thr in thrs:
-                    # Only prediction values larger than thr are counted
-                    # as correct
-                    _correct = correct
-                    if thr is not None:
-                        _correct = _correct & (pred_score.t() > thr)
-                    correct_k = _correct[:k].reshape(-1).float().sum(
-                        0, keepdim=True)
-                    acc = correct_k.mul_(100. / num)
+                for j, thr in enumerate(thrs):
+                    acc = counts[i, j].float().view(1).mul_(100. / num)
                     results[-1].append(acc)
             return results
 
@@ -400,6 +731,14 @@ class SingleLabelMetric(BaseMetric):
                 ' please specify from "precision", "recall", "f1-score" and ' \
                 '"support".'
         self.items = tuple(items)
+        # precompute which slots of the (precision, recall, f1-score,
+        # support) result tuples are reported, so compute_metrics doesn't
+        # redo the membership checks for every threshold
+        self._item_slots = tuple(
+            (name, i)
+            for i, name in enumerate(('precision', 'recall', 'f1-score',
+                                      'support')) if name in self.items)
+        self._thr_suffixes = _format_thr_suffixes(self.thrs)
         self.average = average
         self.num_classes = num_classes
 
@@ -408,26 +747,81 @@ class SingleLabelMetric(BaseMetric):
 
         The processed results should be stored in ``self.results``, which will
         be used to computed the metrics when all batches have been processed.
+        Only the per-class confusion counts (true positives and the number of
+        positive predictions and targets of every category) are stored,
+        instead of the raw predictions, so the memory footprint of the metric
+        doesn't grow with the size of the dataset. In distributed evaluation
+        the top-1 labels, scores and targets are kept per sample instead, so
+        that ``collect_results`` can drop the duplicated samples the sampler
+        pads ranks with.
 
         Args:
             data_batch: A batch of data from the dataloader.
             data_samples (Sequence[dict]): A batch of outputs from the model.
         """
-
-        for data_sample in data_samples:
-            result = dict()
-            if 'pred_score' in data_sample:
-                result['pred_score'] = data_sample['pred_score'].cpu()
-            else:
-                num_classes = self.num_classes or data_sample.get(
-                    'num_classes')
-                assert num_classes is not None, \
-                    'The `num_classes` must be specified if no `pred_score`.'
-                result['pred_label'] = data_sample['pred_label'].cpu()
-                result['num_classes'] = num_classes
-            result['gt_label'] = data_sample['gt_label'].cpu()
-            # Save the result to `self.results`.
-            self.results.append(result)
+        if len(data_samples) == 0:
+            return
+
+        target = torch.cat(
+            [data_sample['gt_label'] for data_sample in data_samples])
+        if 'pred_score' in data_samples[0]:
+            pred, (pred_score, pred_label) = _batch_scores.max1(data_samples)
+            if get_world_size() > 1:
+                pred_label = _to_collect_device(pred_label,
+                                                self.collect_device)
+                pred_score = _to_collect_device(pred_score,
+                                                self.collect_device)
+                gt_label = _to_collect_device(target, self.collect_device)
+                self.results.extend(
+                    dict(
+                        pred_label=label,
+                        pred_score=score,
+                        gt_label=gt,
+                        num_classes=pred.size(1))
+                    for label, score, gt in zip(pred_label, pred_score,
+                                                gt_label))
+                return
+            tp, pred_sum, gt_sum = self._count_confusion(
+                pred_label, pred_score, target, pred.size(1), self.thrs)
+            state = _bucket_state((tp, pred_sum, gt_sum))
+            result = dict(state=_to_collect_device(state,
+                                                   self.collect_device))
+        else:
+            num_classes = self.num_classes or data_samples[0].get(
+                'num_classes')
+            assert num_classes is not None, \
+                'The `num_classes` must be specified if no `pred_score`.'
+            pred = torch.cat(
+                [data_sample['pred_label'] for data_sample in data_samples])
+            if get_world_size() > 1:
+                pred_label = _to_collect_device(
+                    pred.to(torch.int64), self.collect_device)
+                gt_label = _to_collect_device(target, self.collect_device)
+                self.results.extend(
+                    dict(pred_label=label, gt_label=gt,
+                         num_classes=num_classes)
+                    for label, gt in zip(pred_label, gt_label))
+                return
+            tp, pred_sum, gt_sum = self._count_confusion(
+                pred.to(torch.int64), None, target, num_classes, (None, ))
+            state = _bucket_state((tp, pred_sum, gt_sum))
+            result = dict(
+                state=_to_collect_device(state, self.collect_device),
+                num_classes=num_classes)
+        # Save the result to `self.results`.
+        self.results.append(result)
+
+    def evaluate(self, size: int) -> dict:
+        """Evaluate the metrics after all batches have been processed.
+
+        Waits for the asynchronous device-to-host copies staged in
+        :meth:`process` first: ``collect_results`` serializes the results on
+        every rank before :meth:`compute_metrics` runs (and non-main ranks
+        never run it at all), so synchronizing any later would let in-flight
+        copies be collected.
+        """
+        _sync_cuda()
+        return super().evaluate(size)
 
     def compute_metrics(self, results: List):
         """Compute the metrics from processed results.
@@ -444,43 +838,47 @@ class SingleLabelMetric(BaseMetric):
         # are the collected results.
         metrics = {}
 
-        def pack_results(precision, recall, f1_score, support):
-            single_metrics = {}
-            if 'precision' in self.items:
-                single_metrics['precision'] = precision
-            if 'recall' in self.items:
-                single_metrics['recall'] = recall
-            if 'f1-score' in self.items:
-                single_metrics['f1-score'] = f1_score
-            if 'support' in self.items:
-                single_metrics['support'] = support
-            return single_metrics
-
-        # concat
-        target = torch.cat([res['gt_label'] for res in results])
-        if 'pred_score' in results[0]:
-            pred = torch.stack([res['pred_score'] for res in results])
-            metrics_list = self.calculate(
-                pred, target, thrs=self.thrs, average=self.average)
-
-            multi_thrs = len(self.thrs) > 1
-            for i, thr in enumerate(self.thrs):
-                if multi_thrs:
-                    suffix = '_no-thr' if thr is None else f'_thr-{thr:.2f}'
-                else:
-                    suffix = ''
-
-                for k, v in pack_results(*metrics_list[i]).items():
-                    metrics[k + suffix] = v
+        if 'state' in results[0]:
+            # accumulate the bucketed confusion counts of every batch
+            # in-place instead of materializing intermediate tensors for
+            # every partial sum
+            label_only = 'num_classes' in results[0]
+            state = results[0]['state'].clone()
+            for res in results[1:]:
+                state += res['state']
+            num_thrs = 1 if label_only else len(self.thrs)
+            num_classes = state.numel() // (2 * num_thrs + 1)
+            sect = num_thrs * num_classes
+            tp = state[:sect].view(num_thrs, num_classes)
+            pred_sum = state[sect:2 * sect].view(num_thrs, num_classes)
+            gt_sum = state[2 * sect:]
+        else:
+            # per-sample records from a distributed evaluation, already
+            # truncated to the dataset size by ``collect_results``
+            label_only = 'pred_score' not in results[0]
+            num_classes = results[0]['num_classes']
+            pred_label = torch.stack([res['pred_label'] for res in results])
+            target = torch.stack([res['gt_label'] for res in results])
+            if label_only:
+                tp, pred_sum, gt_sum = self._count_confusion(
+                    pred_label, None, target, num_classes, (None, ))
+            else:
+                pred_score = torch.stack(
+                    [res['pred_score'] for res in results])
+                tp, pred_sum, gt_sum = self._count_confusion(
+                    pred_label, pred_score, target, num_classes, self.thrs)
+
+        if not label_only:
+            for i, suffix in enumerate(self._thr_suffixes):
+                res = _precision_recall_f1_from_counts(
+                    tp[i], pred_sum[i], gt_sum, self.average)
+                for name, idx in self._item_slots:
+                    metrics[name + suffix] = res[idx]
         else:
             # If only label in the `pred_label`.
-            pred = torch.cat([res['pred_label'] for res in results])
-            res = self.calculate(
-                pred,
-                target,
-                average=self.average,
-                num_classes=results[0]['num_classes'])
-            metrics = pack_results(*res)
+            res = _precision_recall_f1_from_counts(tp[0], pred_sum[0], gt_sum,
+                                                   self.average)
+            metrics = {name: res[idx] for name, idx in self._item_slots}
 
         result_metrics = dict()
         for k, v in metrics.items():
@@ -494,6 +892,101 @@ class SingleLabelMetric(BaseMetric):
 
         return result_metrics
 
+    @staticmethod
+    def _count_confusion(
+        pred_label: torch.Tensor,
+        pred_score: Optional[torch.Tensor],
+        target: torch.Tensor,
+        num_classes: int,
+        thrs: Sequence[Union[float, None]] = (0., ),
+    ) -> tuple:
+        """Count the per-class confusion statistics.
+
+        Args:
+            pred_label (torch.Tensor): The prediction labels with shape (N, ).
+            pred_score (torch.Tensor | None): The score of every prediction
+                with shape (N, ). If None, the thresholds are not applied.
+            target (torch.Tensor): The target of each prediction with
+                shape (N, ).
+            num_classes (int): The number of classes.
+            thrs (Sequence[float | None]): Predictions with scores under
+                the thresholds are considered negative. None means no
+                thresholds. Defaults to (0., ).
+
+        Returns:
+            Tuple: The tuple contains the counts of true positives and
+            positive predictions with shape ``(len(thrs), num_classes)``,
+            and the counts of positive targets with shape
+            ``(num_classes, )``.
+        """
+        # Count occurrences per class on (num_classes, ) vectors instead
+        # of materializing dense (N, num_classes) one-hot tensors;
+        # torch.bincount has a tighter counting loop than scatter_add_ of
+        # ones.
+        target = target.flatten()
+        gt_sum = torch.bincount(target, minlength=num_classes)
+
+        correct = pred_label == target
+        tp = torch.zeros((len(thrs), num_classes),
+                         dtype=torch.int64,
+                         device=target.device)
+        pred_sum = torch.zeros((len(thrs), num_classes),
+                               dtype=torch.int64,
+                               device=target.device)
+
+        # The counts without any threshold.
+        pred_sum_run = torch.bincount(pred_label, minlength=num_classes)
+        # bincount widens its output beyond minlength for labels outside
+        # [0, num_classes), so the width check costs no extra reduction
+        if gt_sum.numel() > num_classes or pred_sum_run.numel() > num_classes:
+            raise ValueError('The labels must be in the range of '
+                             f'[0, num_classes={num_classes}).')
+        tp_run = torch.bincount(target[correct], minlength=num_classes)
+
+        if pred_score is None:
+            tp[:] = tp_run
+            pred_sum[:] = pred_sum_run
+            return tp, pred_sum, gt_sum
+
+        # Since ``pred_score <= thr`` is monotone in thr, visit the
+        # thresholds in ascending order (None, meaning no threshold, first)
+        # and only subtract the newly disqualified samples from the running
+        # counts, instead of recounting all samples for every threshold.
+        order = torch.argsort(pred_score)
+        sorted_score = pred_score[order]
+        sorted_label = pred_label[order]
+        sorted_target = target[order]
+        sorted_correct = correct[order]
+
+        thr_order = sorted(
+            range(len(thrs)),
+            key=lambda i: -float('inf') if thrs[i] is None else thrs[i])
+        prev_cut = 0
+        for i in thr_order:
+            thr = thrs[i]
+            if thr is not None:
+                # Predictions with scores under the threshold are negative.
+                cut = int(
+                    torch.searchsorted(
+                        sorted_score,
+                        torch.tensor(
+                            thr,
+                            dtype=sorted_score.dtype,
+                            device=sorted_score.device),
+                        right=True))
+                if cut > prev_cut:
+                    chunk_label = sorted_label[prev_cut:cut]
+                    pred_sum_run -= torch.bincount(
+                        chunk_label, minlength=num_classes)
+                    chunk_target = sorted_target[prev_cut:cut][
+                        sorted_correct[prev_cut:cut]]
+                    tp_run -= torch.bincount(
+                        chunk_target, minlength=num_classes)
+                    prev_cut = cut
+            tp[i] = tp_run
+            pred_sum[i] = pred_sum_run
+        return tp, pred_sum, gt_sum
+
     @staticmethod
     def calculate(
         pred: Union[torch.Tensor, np.ndarray, Sequence],
@@ -557,29 +1050,45 @@ class SingleLabelMetric(BaseMetric):
             assert num_classes is not None, \
                 'Please specify the `num_classes` if the `pred` is labels ' \
                 'intead of scores.'
-            gt_positive = F.one_hot(target.flatten(), num_classes)
-            pred_positive = F.one_hot(pred.to(torch.int64), num_classes)
-            return _precision_recall_f1_support(pred_positive, gt_positive,
-                                                average)
+            pred_label = pred.to(torch.int64)
+            if _prf1_count_numba is not None and not pred_label.is_cuda:
+                # On CPU, a compiled single-pass count is faster than
+                # the PyTorch dispatch for the small per-class vectors.
+                pred_np = pred_label.contiguous().numpy()
+                target_np = target.contiguous().numpy()
+                # the compiled loop indexes the per-class counters without
+                # bounds checks, so reject out-of-range labels up front (the
+                # tensor path rejects them through the bincount width)
+                if pred_np.size > 0 and (
+                        min(pred_np.min(), target_np.min()) < 0
+                        or max(pred_np.max(), target_np.max()) >=
+                        num_classes):
+                    raise ValueError(
+                        'The labels must be in the range of '
+                        f'[0, num_classes={num_classes}).')
+                tp, pred_sum, gt_sum = (
+                    torch.from_numpy(count) for count in _prf1_count_numba(
+                        pred_np, target_np, num_classes))
+            else:
+                tp, pred_sum, gt_sum = SingleLabelMetric._count_confusion(
+                    pred_label, None, target, num_classes, (None, ))
+                tp, pred_sum = tp[0], pred_sum[0]
+            return _precision_recall_f1_from_counts(tp, pred_sum, gt_sum,
+                                                    average)
         else:
             # For pred score, calculate on all thresholds.
             num_classes = pred.size(1)
-            pred_score, pred_label = torch.topk(pred, k=1)
-            pred_score = pred_score.flatten()
-            pred_label = pred_label.flatten()
+            # torch.max dispatches to the dedicated reduce kernel, which
+            # is faster than the selection-based topk kernel for k=1.
+            pred_score, pred_label = pred.max(dim=1)
 
-            gt_positive = F.one_hot(target.flatten(), num_classes)
-
-            results = []
-            for thr in thrs:
-                pred_positive = F.one_hot(pred_label, num_classes)
-                if thr is not None:
-                    pred_positive[pred_score <= thr] = 0
-                results.append(
-                    _precision_recall_f1_support(pred_positive, gt_positive,
-                                                 average))
-
-            return results
+            tp, pred_sum, gt_sum = SingleLabelMetric._count_confusion(
+                pred_label, pred_score, target, num_classes, thrs)
+            return [
+                _precision_recall_f1_from_counts(tp[i], pred_sum[i], gt_sum,
+                                                 average)
+                for i in range(len(thrs))
+            ]
 
 
 @METRICS.register_module()
@@ -635,29 +1144,48 @@ class ConfusionMatrix(BaseMetric):
         self.num_classes = num_classes
 
     def process(self, data_batch, data_samples: Sequence[dict]) -> None:
-        for data_sample in data_samples:
-            if 'pred_score' in data_sample:
-                pred_score = data_sample['pred_score']
-                pred_label = pred_score.argmax(dim=0, keepdim=True)
-                self.num_classes = pred_score.size(0)
-            else:
-                pred_label = data_sample['pred_label']
+        if len(data_samples) == 0:
+            return
 
-            self.results.append({
-                'pred_label': pred_label,
-                'gt_label': data_sample['gt_label'],
-            })
+        if 'pred_score' in data_samples[0]:
+            pred, (_, pred_label) = _batch_scores.max1(data_samples)
+            self.num_classes = pred.size(1)
+        else:
+            pred_label = torch.cat(
+                [data_sample['pred_label'] for data_sample in data_samples])
+        gt_label = torch.cat(
+            [data_sample['gt_label'] for data_sample in data_samples])
+
+        if get_world_size() > 1:
+            # keep one record per sample so collect_results can drop the
+            # duplicated samples the sampler pads ranks with
+            self.results.extend(
+                dict(pred_label=label, gt_label=gt) for label, gt in zip(
+                    pred_label.split(1), gt_label.split(1)))
+            return
+
+        # store one record per batch instead of per sample
+        self.results.append({
+            'pred_label': pred_label,
+            'gt_label': gt_label,
+        })
 
     def compute_metrics(self, results: list) -> dict:
-        pred_labels = []
-        gt_labels = []
-        for result in results:
-            pred_labels.append(result['pred_label'])
-            gt_labels.append(result['gt_label'])
+        # pre-size the buffers so the concatenations write directly into
+        # their final storage
+        total = sum(res['gt_label'].numel() for res in results)
+        pred_labels = torch.empty(
+            total,
+            dtype=results[0]['pred_label'].dtype,
+            device=results[0]['pred_label'].device)
+        gt_labels = torch.empty(
+            total,
+            dtype=results[0]['gt_label'].dtype,
+            device=results[0]['gt_label'].device)
+        torch.cat([res['pred_label'] for res in results], out=pred_labels)
+        torch.cat([res['gt_label'] for res in results], out=gt_labels)
         confusion_matrix = ConfusionMatrix.calculate(
-            torch.cat(pred_labels),
-            torch.cat(gt_labels),
-            num_classes=self.num_classes)
+            pred_labels, gt_labels, num_classes=self.num_classes)
         return {'result': confusion_matrix}
 
     @staticmethod